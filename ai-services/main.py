@@ -1,14 +1,16 @@
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+import orjson
 import uvicorn
 import os
 from contextlib import asynccontextmanager
+from starlette.types import Receive, Scope, Send
 
 from src.core.config import settings
 from src.core.logging import setup_logging, logger
-from src.core.database import init_db
+from src.core.database import init_db, close_db
 from src.api.routes import api_router
 from src.core.exceptions import setup_exception_handlers
 
@@ -20,11 +22,12 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     # Startup
     logger.info("Starting AI Services...")
-    await init_db()
+    app.state.db = await init_db()
     logger.info("AI Services started successfully")
     yield
     # Shutdown
     logger.info("Shutting down AI Services...")
+    await close_db(app.state.db)
 
 # Create FastAPI app
 app = FastAPI(
@@ -33,6 +36,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -41,24 +45,46 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
 )
 
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Exception handlers
 setup_exception_handlers(app)
 
-# Health check endpoint
-@app.get("/health")
-async def health_check():
-    """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "ai-services",
-        "version": "1.0.0"
-    }
+# Static response bodies, serialized once at startup
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "ai-services",
+    "version": "1.0.0"
+})
+
+_ROOT_BODY = orjson.dumps({
+    "message": "GoLive AI Services",
+    "version": "1.0.0",
+    "docs": "/docs"
+})
+
+
+class StaticJSONEndpoint:
+    """Pure-ASGI endpoint that sends a pre-serialized JSON body"""
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode())
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": self.headers})
+        await send({"type": "http.response.body", "body": self.body})
+
+
+# Health check endpoint (hit by liveness probes, so it skips Request/Response handling)
+app.add_route("/health", StaticJSONEndpoint(_HEALTH_BODY), methods=["GET"])
 
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
@@ -67,17 +93,17 @@ app.include_router(api_router, prefix="/api/v1")
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "GoLive AI Services",
-        "version": "1.0.0",
-        "docs": "/docs"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8001,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        reload=settings.debug,
+        # One worker per core; reload mode only supports a single process
+        workers=None if settings.debug else max(2, os.cpu_count() or 1),
         log_level="info"
     )
\ No newline at end of file
@@ -1,6 +1,7 @@
 """
 Configuration settings for AI Services
 """
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -18,10 +19,15 @@ class Settings(BaseSettings):
     port: int = 8001
 
     # CORS settings
-    CORS_ORIGINS: list = ["http://localhost:3030", "http://localhost:3000", "*"]
+    CORS_ORIGINS: list = ["http://localhost:3030", "http://localhost:3000"]
 
-    # Database settings (placeholder)
+    # Database settings
     database_url: Optional[str] = None
+    # Connection pool (opt-in; sizes are per Uvicorn worker)
+    db_pool_enabled: bool = False
+    db_pool_min_size: int = 1
+    db_pool_max_size: int = 5
+    db_connect_timeout: float = 10.0
 
     # Redis settings (placeholder)
     redis_url: Optional[str] = None
@@ -34,5 +40,11 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the cached settings instance (usable with Depends)"""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -1,30 +1,52 @@
 """
 Database initialization for AI Services
 """
+import asyncio
 from typing import Optional
 
+import asyncpg
 
-async def init_db() -> Optional[bool]:
+from src.core.config import settings
+from src.core.logging import logger
+
+
+async def init_db() -> Optional[asyncpg.Pool]:
     """
     Initialize database connections
-    This is a placeholder implementation
+
+    Opens a warm asyncpg connection pool when db_pool_enabled is set. The
+    caller stores it on app.state.db, and endpoints acquire connections with:
+
+        async with request.app.state.db.acquire() as conn:
+            ...
+
+    Returns None when the pool is disabled, the database is unreachable or
+    database_url is malformed, so the service still starts without a database.
     """
-    # Placeholder for database initialization
-    # In a real implementation, this would:
-    # - Connect to PostgreSQL/SQLAlchemy
-    # - Run migrations
-    # - Setup connection pools
-    
-    print("🔄 Database initialization (placeholder)")
-    print("📝 Note: Database setup not implemented yet")
-    
-    return True
-
-
-async def close_db() -> None:
-    """Close database connections"""
-    print("🔄 Database connections closed (placeholder)")
+    if not settings.db_pool_enabled or not settings.database_url:
+        logger.info("Database initialization skipped: connection pool not enabled")
+        return None
 
+    try:
+        pool = await asyncpg.create_pool(
+            dsn=settings.database_url,
+            min_size=settings.db_pool_min_size,
+            max_size=settings.db_pool_max_size,
+            timeout=settings.db_connect_timeout,
+            statement_cache_size=1024
+        )
+    except (OSError, ValueError, asyncio.TimeoutError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+        logger.error(f"Database connection pool unavailable: {e}")
+        return None
+
+    logger.info("Database connection pool opened")
+
+    return pool
+
+
+async def close_db(pool: Optional[asyncpg.Pool]) -> None:
+    """Close database connections"""
+    if pool is not None:
+        await pool.close()
 
-# Database connection placeholder
-db_connection = None
\ No newline at end of file
+    logger.info("Database connections closed")
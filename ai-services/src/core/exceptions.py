@@ -2,14 +2,16 @@
 Exception handlers for AI Services
 """
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from typing import Any
 import traceback
 
+from src.core.logging import logger
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """Handle HTTP exceptions"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": "HTTP Error",
@@ -20,9 +22,9 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle general exceptions"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
@@ -40,4 +42,4 @@ def setup_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(HTTPException, http_exception_handler)
     app.add_exception_handler(Exception, general_exception_handler)
     
-    print("✅ Exception handlers configured")
\ No newline at end of file
+    logger.info("Exception handlers configured")
\ No newline at end of file
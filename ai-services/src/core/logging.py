@@ -1,27 +1,51 @@
 """
 Logging configuration for AI Services
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
-def setup_logging(log_level: str = "INFO") -> None:
-    """Setup logging configuration"""
-    
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
-
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
 # Create logger instance
 logger = logging.getLogger("ai-services")
 
-# Setup default logging
-setup_logging()
+# Background listener that writes queued records to stdout
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(log_level: str = "INFO") -> None:
+    """
+    Setup logging configuration
+
+    Request threads only enqueue records; formatting and stdout writes
+    happen on a QueueListener thread. Safe to call more than once.
+    """
+    global _listener
+
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    # The listener's handler applies LOG_FORMAT, so only the message is rendered here
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    logging.basicConfig(
+        level=getattr(logging, log_level.upper()),
+        handlers=[queue_handler]
+    )
 
-logger.info("AI Services logging initialized")
\ No newline at end of file
+    logger.info("AI Services logging initialized")
@@ -0,0 +1,66 @@
+"""
+Tests for the AI Services API routes
+"""
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+client = TestClient(app)
+
+
+def generated_functions(code: str, language: str = "typescript") -> list:
+    """Return the function names the generate-tests endpoint built tests for"""
+    response = client.post("/api/v1/ai/generate-tests", json={"code": code, "language": language})
+    assert response.status_code == 200
+    return [
+        test["fileName"].split(".test.")[0]
+        for test in response.json()["tests"]
+        if test["fileName"] != f"generated.test.{language}"
+    ]
+
+
+@pytest.mark.parametrize("code, expected", [
+    ("function foo(a) {}", ["foo"]),
+    ("export async function load() {}", ["load"]),
+    ("function* gen() { yield 1 }", ["gen"]),
+    ("const f = async (x) => x\nconst g = y => y", ["f", "g"]),
+    ("export const add = (a: number): number => a + b;", ["add"]),
+    ("const id = <T,>(x: T) => x", ["id"]),
+    ("const handler = ({ a, b }: Props): JSX.Element => null", ["handler"]),
+])
+def test_extracts_function_declarations(code, expected):
+    assert generated_functions(code) == expected
+
+
+@pytest.mark.parametrize("code", [
+    "myfunction foo() {}",
+    "const functional = 1;",
+    "functionName();",
+    "return functions.map(f => f)",
+    "// this function handles input\n/* function bar */",
+    "/* unterminated comment\nfunction hidden() {}",
+    "const s = 'function nope'; const t = \"function nope\";",
+    "const x = 5; const y = cond ? a : b;",
+])
+def test_ignores_non_declarations(code):
+    assert generated_functions(code) == []
+
+
+def test_limits_generated_tests_to_five():
+    code = "\n".join(f"function f{i}() {{}}" for i in range(8))
+    assert generated_functions(code) == ["f0", "f1", "f2", "f3", "f4"]
+
+
+@pytest.mark.parametrize("code", [
+    "/* " * 20000,
+    "const a = (" * 20000,
+    "const a = <" * 20000,
+])
+def test_malformed_source_scans_in_linear_time(code):
+    start = time.perf_counter()
+    generated_functions(code)
+    assert time.perf_counter() - start < 1.0